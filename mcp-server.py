@@ -8,10 +8,13 @@ Context Engineering + FastMCP + Gemini API
 from fastmcp import FastMCP
 import google.generativeai as genai
 import os
+import asyncio
 import json
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 import re
 
 # ==================== SETUP ====================
@@ -30,7 +33,7 @@ if not API_KEY:
 
 genai.configure(api_key=API_KEY)
 
-# Pricing tabla (en USD)
+# Pricing tabla (en USD, valores float)
 VEO_PRICING = {
     "720p": {
         4: 0.15,
@@ -44,33 +47,216 @@ VEO_PRICING = {
     }
 }
 
+# Pricing indexado por (resolution, duration) para lookups de un solo paso
+_PRICING_FLAT = {
+    (resolution, duration): price
+    for resolution, durations in VEO_PRICING.items()
+    for duration, price in durations.items()
+}
+
+# Negative prompt por defecto (best practices)
+_DEFAULT_NEGATIVE = (
+    "low quality, blurry, distorted product, watermarks, text overlays, "
+    "harsh shadows, unnatural lighting, oversaturated, unprofessional"
+)
+
+# Cinematography por audiencia objetivo
+_CINEMA_MAP = MappingProxyType({
+    "Tech": "smooth tracking shot with dynamic angles",
+    "Luxury": "slow dolly shot with shallow depth of field",
+    "Youth": "fast-paced montage with transitions",
+    "Professional": "stable medium shot with professional framing"
+})
+_DEFAULT_CINEMA = "tracking shot"
+
+# Templates predefinidos por tipo de producto
+_TEMPLATES = MappingProxyType({
+    "electronics": {
+        "cinematography": "smooth tracking shot with tech aesthetics",
+        "style": "futuristic, sleek, professional tech showcase",
+        "features": ("sharp focus on details", "UI highlights", "hand interactions")
+    },
+    "fashion": {
+        "cinematography": "runway-style dolly shot with model",
+        "style": "editorial, magazine-like, fashionable ambiance",
+        "features": ("fabric texture focus", "motion flow", "elegant poses")
+    },
+    "furniture": {
+        "cinematography": "wide establishing shot transitioning to close-up",
+        "style": "interior design showcase, modern, spacious",
+        "features": ("room context", "scale reference", "material quality")
+    },
+    "cosmetics": {
+        "cinematography": "macro close-up with shallow depth of field",
+        "style": "luxurious, beauty-focused, glamorous lighting",
+        "features": ("product detail", "application demo", "color vibrancy")
+    }
+})
+
+# Recomendaciones fijas devueltas por los tools
+_RECOMMENDATIONS_BUILD = (
+    "Use 2-3 reference images of product for consistency",
+    "Include brand colors in style description",
+    "Test with 4s/720p first to optimize prompt",
+    "Use 'Ingredients to Video' for character consistency"
+)
+
+_RECOMMENDATIONS_VALIDATE = (
+    "Use structured 5-part formula",
+    "Include resolution and duration",
+    "Add negative prompt",
+    "Test with Fast mode first"
+)
+
+# Tabla de precios publica (el JSON se serializa una sola vez al cargar el modulo).
+# Los recursos MCP sirven JSON ya serializado como str: devolver bytes haría
+# que FastMCP lo publique como blob binario en vez de texto.
+_LOADED_AT = datetime.now().isoformat()
+
+def _build_pricing_table() -> Dict[str, Any]:
+    """Tabla de precios nueva en cada llamada (los callers pueden mutarla)"""
+    return {
+        "provider": "Google Veo 3.1",
+        "last_updated": _LOADED_AT,
+        "pricing": {
+            "720p": {
+                "4_seconds": 0.15,
+                "6_seconds": 0.25,
+                "8_seconds": 0.35
+            },
+            "1080p": {
+                "4_seconds": 0.25,
+                "6_seconds": 0.50,
+                "8_seconds": 0.75
+            }
+        },
+        "extras": {
+            "reference_image": 0.05,
+            "audio_generation": 0.10,
+            "4k_processing": 0.15
+        },
+        "bulk_discounts": {
+            "5_to_9_videos": "5%",
+            "10_to_49_videos": "10%",
+            "50_plus_videos": "15%"
+        },
+        "recommendations": {
+            "cost_optimization": [
+                "Start with 4s/720p for testing",
+                "Use fast mode for iterations",
+                "Batch similar products together",
+                "Reuse reference images"
+            ]
+        }
+    }
+
+_PRICING_JSON = json.dumps(_build_pricing_table(), indent=2)
+
+# Mejores practicas (contenido estatico)
+_BEST_PRACTICES_JSON = json.dumps({
+    "prompt_formula": "[Cinematography] + [Subject] + [Action] + [Context] + [Style & Ambiance]",
+    "optimization": [
+        "Test with 4s/720p first ($0.15)",
+        "Use reference images for consistency",
+        "Include negative prompts",
+        "Batch similar videos together",
+        "Cache successful prompts"
+    ],
+    "common_mistakes": [
+        "Too vague cinematography",
+        "Missing context or ambiance",
+        "No negative prompts",
+        "Starting with 1080p/8s (expensive)"
+    ]
+}, indent=2)
+
+# Keywords de cinematography para validacion de prompts
+_CINEMA_KEYWORDS = ("shot", "angle", "camera", "dolly", "tracking", "aerial")
+
 # ==================== UTILITIES ====================
 
-def log_tool_usage(tool_name: str, params: Dict[str, Any]) -> None:
+def _now_iso() -> str:
+    """Timestamp actual en formato ISO"""
+    return datetime.now().isoformat()
+
+def log_tool_usage(
+    tool_name: str,
+    params: Dict[str, Any],
+    timestamp: Optional[str] = None
+) -> None:
     """Log tool usage para auditoría"""
-    logger.info(f"MCP Tool called: {tool_name}", extra={
-        "timestamp": datetime.now().isoformat(),
-        "params": json.dumps(params, default=str)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    # params se pasa sin serializar; el handler decide cómo formatearlo
+    logger.info("MCP Tool called: %s", tool_name, extra={
+        "timestamp": timestamp or _now_iso(),
+        "params": params
     })
 
 def validate_prompt(prompt: str) -> Dict[str, Any]:
     """Validar estructura de prompt"""
-    if len(prompt) < 50:
+    length = len(prompt)
+    if length < 50:
         raise ValueError("Prompt muy corto (mínimo 50 caracteres)")
     
-    if len(prompt) > 2000:
+    if length > 2000:
         raise ValueError("Prompt muy largo (máximo 2000 caracteres)")
     
+    # Tokens solo se estiman para prompts válidos
     return {
         "valid": True,
-        "length": len(prompt),
-        "estimated_tokens": len(prompt.split()) * 1.3
+        "length": length,
+        "estimated_tokens": estimate_tokens(prompt)
     }
 
+def _tokens_from_words(words: int) -> int:
+    """Tokens estimados a partir del número de palabras (~1.3 por palabra)"""
+    return words * 13 // 10
+
 def estimate_tokens(text: str) -> int:
     """Estimar tokens de un texto"""
-    words = len(text.split())
-    return int(words * 1.3)
+    return _tokens_from_words(len(text.split()))
+
+def _calc_video_cost(
+    base_cost: float,
+    quantity: int,
+    reference_images: int,
+    audio: int
+) -> Tuple[float, float]:
+    """Costo por video y total (solo aritmética escalar)"""
+    # 3 reference images a $0.05 + audio $0.10
+    extras = 0.05 * 3 * reference_images + 0.10 * audio
+    per_video = base_cost + extras
+    return per_video, per_video * quantity
+
+def _base_cost(duration_seconds: int, resolution: str) -> float:
+    """Precio base por video ($0.50 si la configuración no está en la tabla)"""
+    return _PRICING_FLAT.get((resolution, duration_seconds), 0.50)
+
+def _compute_cost(
+    duration_seconds: int,
+    resolution: str,
+    include_reference_images: bool = False,
+    include_audio: bool = True,
+    quantity: int = 1
+) -> float:
+    """Costo total estimado para una configuración"""
+    base_cost = _base_cost(duration_seconds, resolution)
+    _, total_cost = _calc_video_cost(
+        base_cost,
+        quantity,
+        int(include_reference_images),
+        int(include_audio)
+    )
+    return total_cost
+
+class PromptStructure(NamedTuple):
+    """Las 5 partes de un prompt Veo"""
+    cinematography: str
+    subject: str
+    action: str
+    context: str
+    style: str
 
 def format_veo_prompt(
     cinematography: str,
@@ -79,31 +265,86 @@ def format_veo_prompt(
     context: str,
     style: str,
     negative: str = ""
-) -> Dict[str, str]:
+) -> Dict[str, Any]:
     """Formato Veo usando 5-part formula"""
     
     # Main prompt
-    main = f"{cinematography} | {subject} | {action} | {context} | {style}"
+    main = " | ".join((cinematography, subject, action, context, style))
     
     # Negative prompt (best practices)
     if not negative:
-        negative = (
-            "low quality, blurry, distorted product, watermarks, text overlays, "
-            "harsh shadows, unnatural lighting, oversaturated, unprofessional"
-        )
+        negative = _DEFAULT_NEGATIVE
     
     return {
         "main_prompt": main.strip(),
-        "negative_prompt": negative.strip(),
-        "structure": {
-            "cinematography": cinematography,
-            "subject": subject,
-            "action": action,
-            "context": context,
-            "style": style
-        }
+        "negative_prompt": negative if negative is _DEFAULT_NEGATIVE else negative.strip(),
+        "structure": PromptStructure(cinematography, subject, action, context, style)
+    }
+
+def _build_product_templates(product_type: str) -> Dict[str, Any]:
+    """Templates predefinidos para un tipo de producto"""
+    return {
+        "product_type": product_type,
+        # Copia superficial: los valores internos son str/tuple inmutables
+        "templates": dict(_TEMPLATES.get(product_type, _TEMPLATES["electronics"])),
+        "recommendation": f"Use as base and customize for your specific {product_type} product"
     }
 
+@lru_cache(maxsize=16)
+def _product_templates_json(product_type: str) -> str:
+    """JSON serializado de templates por tipo (cacheado)"""
+    return json.dumps(_build_product_templates(product_type), indent=2)
+
+# Tipos conocidos serializados al cargar el modulo, fuera del lru_cache para
+# que tipos desconocidos no puedan desalojarlos
+_TEMPLATES_JSON = {
+    product_type: json.dumps(_build_product_templates(product_type), indent=2)
+    for product_type in _TEMPLATES
+}
+
+@lru_cache(maxsize=256)
+def _optimize_cached(
+    product_name: str,
+    product_description: str,
+    desired_style: str,
+    camera_style: str,
+    duration_seconds: int,
+    resolution: str
+) -> Tuple[str, str, PromptStructure, int, float]:
+    """Parte pura de optimize_veo_prompt (cacheada por argumentos)"""
+    
+    # Construir prompt estructura
+    cinematography = f"{camera_style}, dynamic composition, perfect framing"
+    subject = f"premium {product_name}: {product_description}"
+    action = "rotating, showcasing details, highlighting features"
+    context = "minimalist white studio with professional lighting"
+    style = f"{desired_style}, 4K quality, sharp focus, rich colors, studio lighting"
+    
+    prompt_dict = format_veo_prompt(
+        cinematography=cinematography,
+        subject=subject,
+        action=action,
+        context=context,
+        style=style
+    )
+    
+    # Calcular tokens y costo
+    total_text = prompt_dict["main_prompt"] + " " + prompt_dict["negative_prompt"]
+    estimated_tokens = estimate_tokens(total_text)
+    if resolution not in VEO_PRICING:
+        raise ValueError(f"Resolución no soportada: {resolution}")
+    estimated_cost = _PRICING_FLAT.get((resolution, duration_seconds))
+    if estimated_cost is None:
+        estimated_cost = _PRICING_FLAT[(resolution, 6)]  # default
+    
+    return (
+        prompt_dict["main_prompt"],
+        prompt_dict["negative_prompt"],
+        prompt_dict["structure"],
+        estimated_tokens,
+        estimated_cost
+    )
+
 # ==================== MCP TOOLS ====================
 
 @mcp.tool
@@ -130,53 +371,42 @@ def optimize_veo_prompt(
         Prompt optimizado con estructura 5-parte, tokens estimados y costo
     """
     
+    ts = _now_iso()
     log_tool_usage("optimize_veo_prompt", {
         "product": product_name,
         "duration": duration_seconds,
         "resolution": resolution
-    })
+    }, timestamp=ts)
     
     try:
-        # Construir prompt estructura
-        cinematography = f"{camera_style}, dynamic composition, perfect framing"
-        subject = f"premium {product_name}: {product_description}"
-        action = "rotating, showcasing details, highlighting features"
-        context = "minimalist white studio with professional lighting"
-        style = f"{desired_style}, 4K quality, sharp focus, rich colors, studio lighting"
-        
-        prompt_dict = format_veo_prompt(
-            cinematography=cinematography,
-            subject=subject,
-            action=action,
-            context=context,
-            style=style
-        )
-        
-        # Calcular tokens y costo
-        total_text = prompt_dict["main_prompt"] + " " + prompt_dict["negative_prompt"]
-        estimated_tokens = estimate_tokens(total_text)
-        estimated_cost = VEO_PRICING[resolution].get(
-            duration_seconds,
-            VEO_PRICING[resolution][6]  # default
+        main_prompt, negative_prompt, structure, estimated_tokens, estimated_cost = (
+            _optimize_cached(
+                product_name,
+                product_description,
+                desired_style,
+                camera_style,
+                duration_seconds,
+                resolution
+            )
         )
         
         return {
             "success": True,
-            "prompt_optimized": prompt_dict["main_prompt"],
-            "negative_prompt": prompt_dict["negative_prompt"],
-            "structure": prompt_dict["structure"],
+            "prompt_optimized": main_prompt,
+            "negative_prompt": negative_prompt,
+            "structure": structure._asdict(),
             "metadata": {
                 "tokens_estimated": estimated_tokens,
                 "tokens_used_by_gemini": int(estimated_tokens * 0.8),  # Estimación
-                "cost_usd": float(estimated_cost),
+                "cost_usd": estimated_cost,
                 "duration_seconds": duration_seconds,
                 "resolution": resolution,
-                "generated_at": datetime.now().isoformat()
+                "generated_at": ts
             }
         }
     
     except Exception as e:
-        logger.error(f"Error optimizing prompt: {str(e)}")
+        logger.exception("Error optimizing prompt")
         return {
             "success": False,
             "error": str(e),
@@ -215,7 +445,7 @@ def estimate_generation_cost(
     
     try:
         # Base cost
-        base_cost = VEO_PRICING.get(resolution, {}).get(duration_seconds, 0.50)
+        base_cost = _base_cost(duration_seconds, resolution)
         
         if base_cost == 0:
             return {
@@ -224,26 +454,23 @@ def estimate_generation_cost(
                 "code": "INVALID_CONFIG"
             }
         
-        # Calcular adicionales
-        extras = 0
-        if include_reference_images:
-            extras += 0.05 * 3  # 3 reference images
-        if include_audio:
-            extras += 0.10
-        
         # Costo total
-        per_video = base_cost + extras
-        total_cost = per_video * quantity
+        per_video, total_cost = _calc_video_cost(
+            base_cost,
+            quantity,
+            int(include_reference_images),
+            int(include_audio)
+        )
         
         return {
             "success": True,
             "pricing_breakdown": {
-                "base_per_video": float(base_cost),
+                "base_per_video": base_cost,
                 "reference_images": 0.15 if include_reference_images else 0,
                 "audio_generation": 0.10 if include_audio else 0,
-                "per_video_total": float(per_video),
+                "per_video_total": per_video,
                 "quantity": quantity,
-                "total_cost_usd": float(total_cost)
+                "total_cost_usd": total_cost
             },
             "savings_opportunity": {
                 "batch_discount": "10% if batch >= 5" if quantity >= 5 else None,
@@ -252,7 +479,7 @@ def estimate_generation_cost(
         }
     
     except Exception as e:
-        logger.error(f"Error estimating cost: {str(e)}")
+        logger.exception("Error estimating cost")
         return {
             "success": False,
             "error": str(e),
@@ -292,14 +519,12 @@ def build_product_video_prompt(
         # Features como string
         features_str = ", ".join(key_features[:3])
         
-        # Cinematography (varía por audiencia)
-        cinema_map = {
-            "Tech": "smooth tracking shot with dynamic angles",
-            "Luxury": "slow dolly shot with shallow depth of field",
-            "Youth": "fast-paced montage with transitions",
-            "Professional": "stable medium shot with professional framing"
-        }
-        cinematography = cinema_map.get("Tech", "tracking shot")
+        # Cinematography (varía por audiencia, por la primera palabra)
+        audience = target_audience.split(None, 1)
+        cinematography = _CINEMA_MAP.get(
+            audience[0].capitalize() if audience else "",
+            _DEFAULT_CINEMA
+        )
         
         # Build prompt usando template
         product_desc = f"{product_name} featuring {features_str}"
@@ -312,10 +537,11 @@ def build_product_video_prompt(
             style=f"{brand_style}, cinematic, professional, 4K, sharp details, warm lighting"
         )
         
-        # Cost estimation
-        cost = estimate_generation_cost(
-            duration_seconds=video_duration,
-            resolution=resolution,
+        # Cost estimation (sin pasar por el tool MCP)
+        estimated_total = _compute_cost(
+            video_duration,
+            resolution,
+            include_reference_images=False,
             include_audio=True
         )
         
@@ -329,17 +555,12 @@ def build_product_video_prompt(
                 "aspect_ratio": "16:9",
                 "audio": "Professional background music + subtle SFX"
             },
-            "estimated_cost": cost.get("pricing_breakdown", {}).get("total_cost_usd"),
-            "recommendations": [
-                "Use 2-3 reference images of product for consistency",
-                "Include brand colors in style description",
-                "Test with 4s/720p first to optimize prompt",
-                "Use 'Ingredients to Video' for character consistency"
-            ]
+            "estimated_cost": estimated_total,
+            "recommendations": _RECOMMENDATIONS_BUILD
         }
     
     except Exception as e:
-        logger.error(f"Error building prompt: {str(e)}")
+        logger.exception("Error building prompt")
         return {
             "success": False,
             "error": str(e),
@@ -377,15 +598,16 @@ def validate_and_enhance_prompt(
         issues.append("Prompt demasiado largo (> 2000 chars)")
     
     # Advertencias
-    cinema_keywords = ["shot", "angle", "camera", "dolly", "tracking", "aerial"]
-    if not any(kw in prompt.lower() for kw in cinema_keywords):
+    prompt_lower = prompt.lower()
+    if not any(kw in prompt_lower for kw in _CINEMA_KEYWORDS):
         warnings.append("Agregar descripción de movimiento de cámara")
     
-    if "negative" not in prompt.lower() and "not" not in prompt.lower():
+    if "negative" not in prompt_lower and "not" not in prompt_lower:
         warnings.append("Considerar agregar negative prompt")
     
-    # Calcular tokens
-    tokens = estimate_tokens(prompt)
+    # Calcular tokens (una sola cuenta de palabras)
+    words = len(prompt.split())
+    tokens = _tokens_from_words(words)
     
     return {
         "valid": len(issues) == 0,
@@ -393,16 +615,11 @@ def validate_and_enhance_prompt(
         "analysis": {
             "length_chars": len(prompt),
             "estimated_tokens": tokens,
-            "word_count": len(prompt.split())
+            "word_count": words
         },
         "issues": issues,
         "warnings": warnings,
-        "recommendations": [
-            "Use structured 5-part formula",
-            "Include resolution and duration",
-            "Add negative prompt",
-            "Test with Fast mode first"
-        ]
+        "recommendations": _RECOMMENDATIONS_VALIDATE
     }
 
 @mcp.tool
@@ -411,40 +628,7 @@ def get_veo_pricing_table() -> Dict[str, Any]:
     Retorna tabla de precios actual de Veo 3.1
     """
     
-    return {
-        "provider": "Google Veo 3.1",
-        "last_updated": datetime.now().isoformat(),
-        "pricing": {
-            "720p": {
-                "4_seconds": 0.15,
-                "6_seconds": 0.25,
-                "8_seconds": 0.35
-            },
-            "1080p": {
-                "4_seconds": 0.25,
-                "6_seconds": 0.50,
-                "8_seconds": 0.75
-            }
-        },
-        "extras": {
-            "reference_image": 0.05,
-            "audio_generation": 0.10,
-            "4k_processing": 0.15
-        },
-        "bulk_discounts": {
-            "5_to_9_videos": "5%",
-            "10_to_49_videos": "10%",
-            "50_plus_videos": "15%"
-        },
-        "recommendations": {
-            "cost_optimization": [
-                "Start with 4s/720p for testing",
-                "Use fast mode for iterations",
-                "Batch similar products together",
-                "Reuse reference images"
-            ]
-        }
-    }
+    return _build_pricing_table()
 
 @mcp.tool
 def save_prompt_template(
@@ -463,10 +647,11 @@ def save_prompt_template(
     - Reducir tiempo de creación
     """
     
+    ts = _now_iso()
     log_tool_usage("save_prompt_template", {
         "template_name": template_name,
         "product_type": product_type
-    })
+    }, timestamp=ts)
     
     # En producción, guardar en DB
     # Por ahora retornar estructura
@@ -479,7 +664,7 @@ def save_prompt_template(
             "product_type": product_type,
             "tags": tags,
             "notes": notes,
-            "created_at": datetime.now().isoformat(),
+            "created_at": ts,
             "template_id": f"tpl_{template_name.lower().replace(' ', '_')}",
             "usage_count": 0
         },
@@ -501,69 +686,27 @@ def get_product_templates(product_type: str) -> Dict[str, Any]:
     - jewelry
     """
     
-    templates = {
-        "electronics": {
-            "cinematography": "smooth tracking shot with tech aesthetics",
-            "style": "futuristic, sleek, professional tech showcase",
-            "features": ["sharp focus on details", "UI highlights", "hand interactions"]
-        },
-        "fashion": {
-            "cinematography": "runway-style dolly shot with model",
-            "style": "editorial, magazine-like, fashionable ambiance",
-            "features": ["fabric texture focus", "motion flow", "elegant poses"]
-        },
-        "furniture": {
-            "cinematography": "wide establishing shot transitioning to close-up",
-            "style": "interior design showcase, modern, spacious",
-            "features": ["room context", "scale reference", "material quality"]
-        },
-        "cosmetics": {
-            "cinematography": "macro close-up with shallow depth of field",
-            "style": "luxurious, beauty-focused, glamorous lighting",
-            "features": ["product detail", "application demo", "color vibrancy"]
-        }
-    }
-    
-    return {
-        "product_type": product_type,
-        "templates": templates.get(product_type, templates["electronics"]),
-        "recommendation": f"Use as base and customize for your specific {product_type} product"
-    }
+    return _build_product_templates(product_type)
 
 # ==================== RESOURCES ====================
 
-@mcp.resource("veo://pricing")
+@mcp.resource("veo://pricing", mime_type="application/json")
 def veo_pricing_resource() -> str:
     """Recurso: tabla de precios Veo"""
-    pricing = get_veo_pricing_table()
-    return json.dumps(pricing, indent=2)
+    return _PRICING_JSON
 
-@mcp.resource("veo://best-practices")
+@mcp.resource("veo://best-practices", mime_type="application/json")
 def veo_best_practices() -> str:
     """Recurso: mejores prácticas para Veo"""
-    practices = {
-        "prompt_formula": "[Cinematography] + [Subject] + [Action] + [Context] + [Style & Ambiance]",
-        "optimization": [
-            "Test with 4s/720p first ($0.15)",
-            "Use reference images for consistency",
-            "Include negative prompts",
-            "Batch similar videos together",
-            "Cache successful prompts"
-        ],
-        "common_mistakes": [
-            "Too vague cinematography",
-            "Missing context or ambiance",
-            "No negative prompts",
-            "Starting with 1080p/8s (expensive)"
-        ]
-    }
-    return json.dumps(practices, indent=2)
+    return _BEST_PRACTICES_JSON
 
-@mcp.resource("templates://product-{type}")
+@mcp.resource("templates://product-{type}", mime_type="application/json")
 def product_templates_resource(type: str) -> str:
     """Recurso: templates por tipo de producto"""
-    result = get_product_templates(type)
-    return json.dumps(result, indent=2)
+    payload = _TEMPLATES_JSON.get(type)
+    if payload is None:
+        payload = _product_templates_json(type)
+    return payload
 
 # ==================== SERVER STARTUP ====================
 
@@ -572,4 +715,12 @@ if __name__ == "__main__":
     logger.info(f"API Key configurada: {bool(API_KEY)}")
     logger.info("Tools disponibles: optimize_veo_prompt, estimate_generation_cost, build_product_video_prompt, validate_and_enhance_prompt, save_prompt_template")
     
+    # Event loop más rápido si uvloop está instalado (opcional)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Event loop: uvloop")
+    except ImportError:
+        logger.info("Event loop: asyncio (uvloop no instalado)")
+    
     mcp.run()